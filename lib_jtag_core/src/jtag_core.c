@@ -36,6 +36,8 @@
 
 #include "drivers/drivers_list.h"
 
+#include "script/env.h"
+
 #include "config_script.h"
 
 jtag_core * jtagcore_init()
@@ -627,6 +629,50 @@ int jtagcore_set_pin_state(jtag_core * jc, int device, int pin, int type,int sta
 
 }
 
+int jtagcore_set_pin_states_bulk(jtag_core * jc, int device, const int * triples, int count)
+{
+	jtag_bsdl * bsdl_file;
+	int i,pin;
+
+	if (jc && triples && count >= 0 && device >= 0)
+	{
+		if (device < jc->nb_of_devices_in_chain && device < MAX_NB_JTAG_DEVICE)
+		{
+			if (jc->devices_list[device].bsdl)
+			{
+				bsdl_file = jc->devices_list[device].bsdl;
+
+				// Check all the pins first : the chain buffer is left untouched on error.
+				for (i = 0; i < count; i++)
+				{
+					pin = triples[(i*3) + 0];
+
+					if (pin < 0 || pin >= bsdl_file->number_of_pins)
+						return JTAG_CORE_BAD_PARAMETER;
+
+					if (bsdl_file->pins_list[pin].out_bit_number == -1)
+						return JTAG_CORE_BAD_PARAMETER;
+				}
+
+				for (i = 0; i < count; i++)
+				{
+					pin = triples[(i*3) + 0];
+
+					// Two-state output pins don't have any control cell.
+					if (bsdl_file->pins_list[pin].ctrl_bit_number != -1)
+						jtagcore_set_pin_state(jc, device, pin, JTAG_CORE_OE, triples[(i*3) + 1]);
+
+					jtagcore_set_pin_state(jc, device, pin, JTAG_CORE_OUTPUT, triples[(i*3) + 2]);
+				}
+
+				return JTAG_CORE_NO_ERROR;
+			}
+		}
+	}
+
+	return JTAG_CORE_BAD_PARAMETER;
+}
+
 int jtagcore_get_pin_id(jtag_core * jc, int device, char * pinname)
 {
 	jtag_bsdl * bsdl_file;
@@ -981,6 +1027,43 @@ jtag_error:
 	return JTAG_CORE_IO_ERROR;
 }
 
+int jtagcore_scan_and_read_pins(jtag_core * jc, int device, unsigned char * states, int maxsize)
+{
+	jtag_bsdl * bsdl_file;
+	int pin,ret;
+
+	if (jc && states && device >= 0)
+	{
+		if (device < jc->nb_of_devices_in_chain && device < MAX_NB_JTAG_DEVICE)
+		{
+			if (jc->devices_list[device].bsdl)
+			{
+				bsdl_file = jc->devices_list[device].bsdl;
+
+				if (maxsize < bsdl_file->number_of_pins)
+					return JTAG_CORE_MEM_ERROR;
+
+				ret = jtagcore_push_and_pop_chain(jc, JTAG_CORE_WRITE_READ);
+				if (ret < 0)
+					return ret;
+
+				for (pin = 0; pin < bsdl_file->number_of_pins; pin++)
+				{
+					ret = jtagcore_get_pin_state(jc, device, pin, JTAG_CORE_INPUT);
+					if (ret < 0)
+						states[pin] = 0xFF;
+					else
+						states[pin] = ret;
+				}
+
+				return pin;
+			}
+		}
+	}
+
+	return JTAG_CORE_BAD_PARAMETER;
+}
+
 int jtagcore_get_number_of_probes_drv(jtag_core * jc)
 {
 	int i;
@@ -1042,8 +1125,31 @@ int jtagcore_select_and_open_probe(jtag_core * jc, int probe_id)
 
 void jtagcore_deinit(jtag_core * jc)
 {
+	int i;
+
 	if( jc )
 	{
+		// Release the probe first : an opened probe left behind can hang the host process.
+		if (jc->io_functions.drv_DeInit)
+		{
+			jc->io_functions.drv_DeInit(jc);
+			memset(&jc->io_functions, 0, sizeof(drv_ptr));
+		}
+
+		for (i = 0; i < MAX_NB_JTAG_DEVICE; i++)
+		{
+			if (jc->devices_list[i].bsdl)
+				unload_bsdlfile(jc, jc->devices_list[i].bsdl);
+
+			if (jc->devices_list[i].in_boundary_scan)
+				free(jc->devices_list[i].in_boundary_scan);
+
+			if (jc->devices_list[i].out_boundary_scan)
+				free(jc->devices_list[i].out_boundary_scan);
+		}
+
+		free_env_vars((envvar_entry *)jc->envvar);
+
 		free( jc );
 	}
 }
@@ -149,6 +149,15 @@ int jtagcore_get_pin_state(jtag_core * jc, int device, int pin, int type);
 
 int jtagcore_set_pin_state(jtag_core * jc, int device, int pin, int type, int state);
 
+// jtagcore_set_pin_states_bulk : Set the OE and OUTPUT states of several pins in one call
+// "device" should be between 0 and "the number of devices into the chain" - 1
+// "triples" is an array of "count" { pin, oe state, output state } integer triples
+// The oe state is ignored for the pins without control cell (two-state outputs).
+// Return JTAG_CORE_BAD_PARAMETER without changing any pin if a pin id is out of range or has no output cell.
+// Only the chain buffer is updated : call jtagcore_push_and_pop_chain to apply it.
+
+int jtagcore_set_pin_states_bulk(jtag_core * jc, int device, const int * triples, int count);
+
 #define JTAG_CORE_INPUT     0x01
 #define JTAG_CORE_OUTPUT    0x02
 #define JTAG_CORE_OE        0x04
@@ -172,6 +181,15 @@ int jtagcore_push_and_pop_chain(jtag_core * jc, int mode);
 #define JTAG_CORE_WRITE_READ  0x00
 #define JTAG_CORE_WRITE_ONLY  0x01
 
+// jtagcore_scan_and_read_pins : Do a JTAG_CORE_WRITE_READ chain transaction and return all the device input pins states.
+// "device" should be between 0 and "the number of devices into the chain" - 1
+// and a bsdl must be attached to this device
+// "states" receive one byte per pin (index = pin id) : 0x00 / 0x01, or 0xFF if the pin has no input cell.
+// "maxsize" is the "states" buffer size : it must be at least the jtagcore_get_number_of_pins value.
+// Return the number of pins written into "states", or JTAG_CORE_MEM_ERROR (nothing done) if "states" is too small.
+
+int jtagcore_scan_and_read_pins(jtag_core * jc, int device, unsigned char * states, int maxsize);
+
 //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 // I2C over JTAG API functions
 